@@ -7,6 +7,8 @@ from personalfinance import cashflow_model, excel_model, helpers
 
 # pylint: disable=too-many-instance-attributes,abstract-class-instantiated
 
+PERIOD_SYMBOLS = {"weekly": "W", "monthly": "M", "quarterly": "Q", "yearly": "Y"}
+
 
 class Cashflow:
     """
@@ -124,8 +126,8 @@ class Cashflow:
             function.
             4. Groups transactions by yearly, quarterly, and monthly time periods using the
             'group_transactions_by_periods' function.
-            5. Creates yearly, quarterly, and monthly cash flow overviews using the 'create_period_overviews'
-            function.
+            5. Creates the Excel template using the 'create_excel_template' function, which builds the
+            cash flow overviews (including totals) for the periods defined in the configuration.
 
         Returns:
             pd.DataFrame: The processed cash flow dataset.
@@ -152,9 +154,6 @@ class Cashflow:
             self._daily_cash_flow_dataset = self._custom_dataset
 
         if self._cfg["excel"]["file_name"] and write_to_excel:
-            for period in ["weekly", "monthly", "quarterly", "yearly"]:
-                self.get_period_overview(period=period, include_totals=True)
-
             print(
                 f"{helpers.Style.BOLD}Creating the Excel Template{helpers.Style.RESET}"
             )
@@ -337,8 +336,8 @@ class Cashflow:
             None
 
         Note:
-            - The function iterates through each transaction and checks for keyword matches in the
-            description columns.
+            - The function iterates through each unique description and checks for keyword matches,
+            after which the best match of the description columns is assigned to each transaction.
             - The 'categorized_percentage' represents the percentage of transactions that have been
             successfully categorized.
             - The function also reports unmatched keywords below the threshold if any.
@@ -452,11 +451,19 @@ class Cashflow:
                 "No amount columns found in the cash flow dataset. Please specify the columns in the configuration file."
             )
         else:
-            for indicator, multiplier in cost_or_income_criteria.items():
-                self._daily_cash_flow_dataset.loc[
-                    self._daily_cash_flow_dataset[cost_or_income_column] == indicator,
-                    self._amount_column,
-                ] *= multiplier
+            # Map every indicator to its multiplier at once so that the amount column is
+            # only multiplied a single time instead of once per indicator
+            multipliers = (
+                self._daily_cash_flow_dataset[cost_or_income_column]
+                .map(cost_or_income_criteria)
+                .astype("float")
+                .fillna(1)
+            )
+
+            self._daily_cash_flow_dataset[self._amount_column] = (
+                self._daily_cash_flow_dataset[self._amount_column].to_numpy()
+                * multipliers.to_numpy()
+            )
 
         return self._daily_cash_flow_dataset
 
@@ -464,9 +471,9 @@ class Cashflow:
         """
         Group transactions in the cash flow dataset by different time periods.
 
-        This function groups transactions in the cash flow dataset by yearly, quarterly, and monthly time
-        periods using pandas Grouper. It creates separate datasets for each period and assigns appropriate
-        index names to the resulting DataFrames.
+        This function groups transactions in the cash flow dataset by weekly, monthly, quarterly, and yearly
+        time periods by deriving the period from the date of each transaction. It creates separate datasets
+        for each period and assigns appropriate index names to the resulting DataFrames.
 
         Returns:
             None
@@ -485,40 +492,20 @@ class Cashflow:
         if period_string == "daily":
             return self._daily_cash_flow_dataset
 
-        if period_string == "weekly":
-            self._weekly_cash_flow_dataset = self._daily_cash_flow_dataset.groupby(
-                pd.Grouper(freq="W")
-            ).apply(lambda x: x)
-            self._weekly_cash_flow_dataset.index.names = ["Weekly", "Date"]
-
-            return self._weekly_cash_flow_dataset
-
-        if period_string == "monthly":
-            self._monthly_cash_flow_dataset = self._daily_cash_flow_dataset.groupby(
-                pd.Grouper(freq="M")
-            ).apply(lambda x: x)
-            self._monthly_cash_flow_dataset.index.names = ["Monthly", "Date"]
-
-            return self._monthly_cash_flow_dataset
-
-        if period_string == "quarterly":
-            self._quarterly_cash_flow_dataset = self._daily_cash_flow_dataset.groupby(
-                pd.Grouper(freq="Q")
-            ).apply(lambda x: x)
-            self._quarterly_cash_flow_dataset.index.names = ["Quarterly", "Date"]
+        if period_string not in PERIOD_SYMBOLS:
+            raise ValueError(
+                "Period not supported. Please use 'daily', 'weekly', 'monthly', 'quarterly', or 'yearly'."
+            )
 
-            return self._quarterly_cash_flow_dataset
-        if period_string == "yearly":
-            self._yearly_cash_flow_dataset = self._daily_cash_flow_dataset.groupby(
-                pd.Grouper(freq="Y")
-            ).apply(lambda x: x)
-            self._yearly_cash_flow_dataset.index.names = ["Yearly", "Date"]
+        transactions_overview = cashflow_model.create_transactions_overview(
+            dataset=self._daily_cash_flow_dataset,
+            period_string=period_string,
+            period_symbol=PERIOD_SYMBOLS[period_string],
+        )
 
-            return self._yearly_cash_flow_dataset
+        setattr(self, f"_{period_string}_cash_flow_dataset", transactions_overview)
 
-        raise ValueError(
-            "Period not supported. Please use 'daily', 'weekly', 'monthly', 'quarterly', or 'yearly'."
-        )
+        return transactions_overview
 
     def get_period_overview(
         self,
@@ -577,69 +564,28 @@ class Cashflow:
 
         period_string = period.lower()
 
-        if period_string == "weekly":
-            if self._weekly_cash_flow_dataset.empty:
-                self.get_transactions_overview(period=period_string)
-
-            self._weekly_overview = cashflow_model.create_period_overview(
-                dataset=self._weekly_cash_flow_dataset,
-                period_string=period_string,
-                amount_column=self._amount_column,
-                categories=categories,
-                category_exclusions=category_exclusions,
-                include_totals=include_totals,
-            )
-
-            return self._weekly_overview
-
-        if period_string == "monthly":
-            if self._monthly_cash_flow_dataset.empty:
-                self.get_transactions_overview(period=period_string)
-
-            self._monthly_overview = cashflow_model.create_period_overview(
-                dataset=self._monthly_cash_flow_dataset,
-                period_string=period_string,
-                amount_column=self._amount_column,
-                categories=categories,
-                category_exclusions=category_exclusions,
-                include_totals=include_totals,
-            )
-
-            return self._monthly_overview
-
-        if period_string == "quarterly":
-            if self._quarterly_cash_flow_dataset.empty:
-                self.get_transactions_overview(period=period_string)
-
-            self._quarterly_overview = cashflow_model.create_period_overview(
-                dataset=self._quarterly_cash_flow_dataset,
-                period_string=period_string,
-                amount_column=self._amount_column,
-                categories=categories,
-                category_exclusions=category_exclusions,
-                include_totals=include_totals,
+        if period_string not in PERIOD_SYMBOLS:
+            raise ValueError(
+                "Period not supported. Please use 'weekly', 'monthly', 'quarterly', or 'yearly'."
             )
 
-            return self._quarterly_overview
+        transactions_overview = getattr(self, f"_{period_string}_cash_flow_dataset")
 
-        if period_string == "yearly":
-            if self._yearly_cash_flow_dataset.empty:
-                self.get_transactions_overview(period=period_string)
+        if transactions_overview.empty:
+            transactions_overview = self.get_transactions_overview(period=period_string)
 
-            self._yearly_overview = cashflow_model.create_period_overview(
-                dataset=self._yearly_cash_flow_dataset,
-                period_string=period_string,
-                amount_column=self._amount_column,
-                categories=categories,
-                category_exclusions=category_exclusions,
-                include_totals=include_totals,
-            )
+        period_overview = cashflow_model.create_period_overview(
+            dataset=transactions_overview,
+            period_string=period_string,
+            amount_column=self._amount_column,
+            categories=categories,
+            category_exclusions=category_exclusions,
+            include_totals=include_totals,
+        )
 
-            return self._yearly_overview
+        setattr(self, f"_{period_string}_overview", period_overview)
 
-        raise ValueError(
-            "Period not supported. Please use 'weekly', 'monthly', 'quarterly', or 'yearly'."
-        )
+        return period_overview
 
     def create_excel_template(
         self,
@@ -659,7 +605,8 @@ class Cashflow:
         Creates an Excel file with multiple data sheets including monthly, quarterly,
         and yearly overviews if the corresponding data is available. The data sheets are
         populated with dataframes provided by the class attributes _monthly_overview,
-        _quarterly_overview, and _yearly_overview.
+        _quarterly_overview, and _yearly_overview. These overviews are (re)created including
+        totals for the periods defined in the configuration.
 
         The Excel file is saved with the specified name or the default name from the
         configuration. The date and datetime formats in the Excel file are set to
@@ -678,50 +625,39 @@ class Cashflow:
 
         currency = currency if currency else self._cfg["excel"]["currency"]
 
-        writer = pd.ExcelWriter(
-            excel_file_name,
-            engine="xlsxwriter",
-            date_format="yyyy-mm-dd",
-            datetime_format="yyyy-mm-dd",
-        )
-
         overviews = [overview.lower() for overview in self._cfg["excel"]["overviews"]]
 
-        if "daily" in overviews:
-            excel_model.create_transactions_excel_report(
-                writer,
-                dataset=self._daily_cash_flow_dataset.copy(),
-                sheet_name="Daily Overview",
-                currency=currency,
-            )
+        # All overviews are collected before the workbook is opened so that an error in
+        # creating one of them does not leave an empty or partially written file behind
+        period_overviews = {}
 
-        if "weekly" in overviews:
-            excel_model.create_overview_excel_report(
-                writer,
-                dataset=self._weekly_overview.copy(),
-                sheet_name="Weekly Overview",
-                currency=currency,
-            )
-        if "monthly" in overviews:
-            excel_model.create_overview_excel_report(
-                writer,
-                dataset=self._monthly_overview.copy(),
-                sheet_name="Monthly Overview",
-                currency=currency,
-            )
-        if "quarterly" in overviews:
-            excel_model.create_overview_excel_report(
-                writer,
-                dataset=self._quarterly_overview.copy(),
-                sheet_name="Quarterly Overview",
-                currency=currency,
-            )
-        if "yearly" in overviews:
-            excel_model.create_overview_excel_report(
-                writer,
-                dataset=self._yearly_overview.copy(),
-                sheet_name="Yearly Overview",
-                currency=currency,
-            )
+        for period in ["weekly", "monthly", "quarterly", "yearly"]:
+            if period in overviews:
+                # The overviews are always rebuilt as a cached overview may have been created
+                # with different arguments (e.g. without totals), the grouped transactions
+                # are reused so this only aggregates them again
+                period_overviews[period] = self.get_period_overview(
+                    period=period, include_totals=True
+                )
 
-        writer.close()
+        with pd.ExcelWriter(
+            excel_file_name,
+            engine="xlsxwriter",
+            date_format="yyyy-mm-dd",
+            datetime_format="yyyy-mm-dd",
+        ) as writer:
+            if "daily" in overviews:
+                excel_model.create_transactions_excel_report(
+                    writer,
+                    dataset=self._daily_cash_flow_dataset.copy(),
+                    sheet_name="Daily Overview",
+                    currency=currency,
+                )
+
+            for period, period_overview in period_overviews.items():
+                excel_model.create_overview_excel_report(
+                    writer,
+                    dataset=period_overview.copy(),
+                    sheet_name=f"{period.capitalize()} Overview",
+                    currency=currency,
+                )
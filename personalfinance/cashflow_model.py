@@ -1,6 +1,7 @@
 """Cashflow Module"""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -59,27 +60,42 @@ def read_cashflow_dataset(
         ValueError: If no amount columns are found in the cash flow dataset. Ensure that amount
             columns are defined either in the configuration or explicitly.
     """
-    combined_cash_flow_dataset = pd.DataFrame()
+    cash_flow_datasets = []
+    excel_files = []
     additional_files = []
     original_excel_location = excel_location.copy()
 
+    # A new list is built instead of removing the directories from 'excel_location' while
+    # iterating over it, which would skip the entry that follows each directory
     for file in excel_location:
-        if file.split(".")[-1] not in ["xlsx", "csv"]:
-            excel_location.remove(file)
-
-            for sub_file in os.listdir(file):
-                if sub_file.endswith(("xlsx", "csv")):
-                    additional_files.append(f"{file}/{sub_file}")
-
-    excel_location = excel_location + additional_files
+        if os.path.splitext(file)[1] in [".xlsx", ".csv"]:
+            excel_files.append(file)
+        else:
+            with os.scandir(file) as directory:
+                for sub_file in directory:
+                    extension = os.path.splitext(sub_file.name)[1]
+
+                    if sub_file.is_file() and extension in [".xlsx", ".csv"]:
+                        additional_files.append(f"{file}/{sub_file.name}")
+
+    excel_location = excel_files + additional_files
+
+    # Reading the files is mostly spent in I/O and the Excel and CSV parsers, the files
+    # are therefore read in parallel while the order of the files is kept intact
+    if len(excel_location) > 1:
+        with ThreadPoolExecutor() as executor:
+            cash_flow_statements = list(
+                tqdm(
+                    executor.map(helpers.read_excel, excel_location),
+                    total=len(excel_location),
+                    desc="Reading Cash Flow Files",
+                )
+            )
+    else:
+        cash_flow_statements = [helpers.read_excel(file) for file in excel_location]
 
-    for file in (
-        tqdm(excel_location, desc="Reading Cash Flow Files")
-        if len(excel_location) > 1
-        else excel_location
-    ):
-        cash_flow_statement = helpers.read_excel(file)
-        cash_flow_statement.columns = cash_flow_statement.columns.str.lower()
+    for file, raw_cash_flow_statement in zip(excel_location, cash_flow_statements):
+        raw_cash_flow_statement.columns = raw_cash_flow_statement.columns.str.lower()
 
         (
             cash_flow_statement,
@@ -89,7 +105,7 @@ def read_cashflow_dataset(
             selected_cost_or_income_column,
             selected_cost_or_income_criteria,
         ) = format_cash_flow_dataset(  # type: ignore
-            dataset=cash_flow_statement,
+            dataset=raw_cash_flow_statement,
             date_column=date_column,
             date_format=date_format,
             description_columns=description_columns,
@@ -98,29 +114,46 @@ def read_cashflow_dataset(
             decimal_seperator=decimal_seperator,
         )
 
-        if cash_flow_statement.duplicated().any() and adjust_duplicates:
+        # Marks the rows that do not occur again further down in the file, any row that is
+        # not marked is therefore a duplicate
+        last_occurrences = ~cash_flow_statement.duplicated(keep="last").to_numpy()
+
+        if not last_occurrences.all() and adjust_duplicates:
             print(f"Found duplicates in {file} These will be added together.")
-            duplicates = cash_flow_statement[cash_flow_statement.duplicated()]
-            originals = cash_flow_statement[
-                cash_flow_statement.duplicated(keep="first")
-            ]
 
-            number_columns = duplicates.select_dtypes(np.number).columns.intersection(
-                originals.select_dtypes(np.number).columns
-            )
-            duplicates.loc[:, number_columns] = duplicates.loc[:, number_columns].add(
-                originals[number_columns], fill_value=0
+            # Identical rows are combined into their last occurrence for which the numeric
+            # columns are multiplied by the number of times the row occurs in the file
+            row_groups = (
+                cash_flow_statement.groupby(
+                    list(cash_flow_statement.columns),
+                    sort=False,
+                    dropna=False,
+                    observed=True,
+                )
+                .ngroup()
+                .to_numpy()
             )
+            occurrences = np.bincount(row_groups)[row_groups[last_occurrences]]
 
-            cash_flow_statement = pd.concat(
-                [cash_flow_statement, duplicates]
-            ).drop_duplicates(keep=False)
+            cash_flow_statement = cash_flow_statement[last_occurrences].copy()
+            number_columns = cash_flow_statement.select_dtypes(np.number).columns
 
-        combined_cash_flow_dataset = pd.concat(
-            [combined_cash_flow_dataset, cash_flow_statement], axis=0
-        )
+            cash_flow_statement[number_columns] = cash_flow_statement[
+                number_columns
+            ].mul(occurrences, axis=0)
+
+        cash_flow_datasets.append(cash_flow_statement)
+
+    # The datasets are combined at once as concatenating within the loop copies all
+    # previously read datasets again for every file
+    if len(cash_flow_datasets) > 1:
+        combined_cash_flow_dataset = pd.concat(cash_flow_datasets, axis=0)
+    elif cash_flow_datasets:
+        combined_cash_flow_dataset = cash_flow_datasets[0]
+    else:
+        combined_cash_flow_dataset = pd.DataFrame()
 
-    if combined_cash_flow_dataset.duplicated().any() and adjust_duplicates:
+    if adjust_duplicates and combined_cash_flow_dataset.duplicated().any():
         if adjust_duplicates:
             print(
                 "Found duplicates in the combination of datasets. This is usually due to overlapping periods. "
@@ -141,8 +174,11 @@ def read_cashflow_dataset(
             "in the documentation as found here: https://github.com/JerBouma/PersonalFinance"
         )
 
-    combined_cash_flow_dataset.columns = combined_cash_flow_dataset.columns.str.lower()
-    combined_cash_flow_dataset = combined_cash_flow_dataset.sort_index(ascending=False)
+    # The dates are still datetime64 at this point which sorts considerably faster than a
+    # PeriodIndex, a stable sort keeps the order of the transactions within the same day
+    combined_cash_flow_dataset = combined_cash_flow_dataset.sort_index(
+        ascending=False, kind="stable"
+    )
     combined_cash_flow_dataset.index = combined_cash_flow_dataset.index.to_period(
         freq="D"
     )
@@ -216,10 +252,14 @@ def format_cash_flow_dataset(
         )
     date_column_first = date_column_match[0]
 
-    dataset = dataset.set_index(date_column_first)
+    if not pd.api.types.is_datetime64_any_dtype(dataset[date_column_first]):
+        # Bank statements contain many transactions on the same day, caching ensures that each
+        # unique date is only parsed once
+        dataset[date_column_first] = pd.to_datetime(
+            dataset[date_column_first], format=date_format, cache=True
+        )
 
-    if not isinstance(dataset.index, pd.DatetimeIndex):
-        dataset.index = pd.to_datetime(dataset.index, format=date_format)
+    dataset = dataset.set_index(date_column_first)
 
     description_columns = [column.lower() for column in description_columns]
     description_columns_match = [
@@ -232,8 +272,7 @@ def format_cash_flow_dataset(
         )
     description_columns = description_columns_match
 
-    for column in description_columns:
-        dataset[column] = dataset[column].astype("category")
+    dataset = dataset.astype({column: "category" for column in description_columns})
 
     amount_column = [column.lower() for column in amount_column]
     amount_column_match = [
@@ -246,17 +285,18 @@ def format_cash_flow_dataset(
         )
     amount_column_first = amount_column_match[0]
 
-    if decimal_seperator == "," and isinstance(
-        dataset[amount_column_first].iloc[0], str
-    ):
-        dataset[amount_column_first] = dataset[amount_column_first].str.replace(".", "")
-        dataset[amount_column_first] = dataset[amount_column_first].str.replace(
-            ",", "."
-        )
-    if decimal_seperator == "." and isinstance(
-        dataset[amount_column_first].iloc[0], str
-    ):
-        dataset[amount_column_first] = dataset[amount_column_first].str.replace(",", "")
+    if isinstance(dataset[amount_column_first].iloc[0], str):
+        # Literal (non-regex) replacements keep this a single vectorized pass per separator
+        if decimal_seperator == ",":
+            dataset[amount_column_first] = (
+                dataset[amount_column_first]
+                .str.replace(".", "", regex=False)
+                .str.replace(",", ".", regex=False)
+            )
+        elif decimal_seperator == ".":
+            dataset[amount_column_first] = dataset[amount_column_first].str.replace(
+                ",", "", regex=False
+            )
 
     dataset[amount_column_first] = dataset[amount_column_first].astype("float")
 
@@ -310,16 +350,18 @@ def apply_categorization(
 
     The calculations are done as follows:
 
-        1. The function loops through each row in the dataset.
-        2. It then loops through each category in the categorization rules.
-        3. For each category, it looks at each defined description column and compares the description
-            with each keyword in the category. It does so for EVERY keyword in the category.
-        4. For each category it found a match (that is higher than the threshold), it adds the match
-            value to a list of matches for that category. This uses the fuzzywuzzy library to calculate
-            the match value.
-        5. Once it has gone through all categories, it calculates the max match value for each
-            category and assigns the category with the highest max match value to the transaction.
-        6. If no category has a match value higher than the threshold, the transaction is assigned to
+        1. The function collects each unique description found in the description columns. As bank
+            statements tend to repeat the same descriptions (e.g. a monthly subscription), this means
+            each description only needs to be evaluated once.
+        2. Each unique description is compared with EVERY keyword of EVERY category which results in
+            a matrix of match values. This uses the fuzzywuzzy library to calculate the match value.
+            Keywords that are defined in multiple categories are only compared once.
+        3. For each unique description, it keeps the category and keyword with the highest match value
+            (that is higher than the threshold).
+        4. For each transaction, it then selects the description column with the highest match value and
+            assigns the corresponding category to the transaction. In case of equal match values, the
+            category that is defined first in the categorization rules is chosen.
+        5. If no category has a match value higher than the threshold, the transaction is assigned to
             the 'Other' category.
 
     This is a time consuming process (even though it still is just 2-3 minutes) but it is done to ensure
@@ -355,66 +397,164 @@ def apply_categorization(
             "'desciption_columns'."
         )
 
-    categories = []
-    keyword_matches = []
-    certainty = []
-    total_matches = {}
-
-    for _, row in tqdm(
-        dataset.iterrows(), total=dataset.shape[0], desc="Categorizing Transactions"
-    ):
-        category_decision = "Other"
-        keyword_match = None
-        result: dict[str, list[tuple[str, int]]] = {}
-
-        for category, keywords in categorization.items():
-            result[category] = []
-
-            for column in description_columns:
-                if row[column] != row[column]:
-                    # In case the data is NaN
-                    continue
-
-                lowered_description = row[column].lower()
-
-                for keyword in keywords:
-                    if keyword not in total_matches:
-                        total_matches[keyword] = 0
-
-                    match = fuzz.partial_ratio(lowered_description, keyword.lower())
-                    total_matches[keyword] = (
-                        match
-                        if match > total_matches[keyword]
-                        else total_matches[keyword]
-                    )
-
-                    if match >= categorization_threshold:
-                        result[category].append((keyword, match))
-
-        highest_value = 0
-        for key, values in result.items():
-            # This is done to ensure you have the best fit for the transaction. If you have a description
-            # that says "Apple Bandit" and you have the keyword "Apple" in the "Groceries" categorization
-            # and "Apple Bandit" in the "Drinks" categorization, it will be assigned to "Drinks" because
-            # the match value is higher. This would not be achieved if the first match that crosses the
-            # Threshold is reached (which would be "Groceries" in this case).
-            for keyword, value in values:
-                if value > highest_value:
-                    keyword_match = keyword
-                    highest_value = value
-                    category_decision = key
-
-        categories.append(category_decision)
-        keyword_matches.append(keyword_match)
-        certainty.append(highest_value / 100)
-
-    dataset["category"] = categories
-    dataset["keyword"] = keyword_matches
-    dataset["certainty"] = certainty
+    categories = list(categorization.keys())
+    keyword_category_positions = np.array(
+        [
+            category_position
+            for category_position, keywords in enumerate(categorization.values())
+            for _ in keywords
+        ],
+        dtype=int,
+    )
+    keyword_names = np.array(
+        [keyword for keywords in categorization.values() for keyword in keywords],
+        dtype=object,
+    )
+
+    # Keywords are lowercased once and keywords that occur multiple times (e.g. in different
+    # categories) are only compared once with each description
+    keyword_positions, distinct_keywords = pd.factorize(
+        np.array([keyword.lower() for keyword in keyword_names], dtype=object)
+    )
+
+    # Without any keywords there is nothing to match, every transaction is therefore
+    # assigned to the 'Other' category
+    if len(distinct_keywords) == 0:
+        dataset["category"] = pd.Categorical(
+            ["Other"] * len(dataset),
+            categories=list(dict.fromkeys(categories + ["Other"])),
+        )
+        dataset["keyword"] = None
+        dataset["certainty"] = 0.0
+
+        return dataset, {}
+
+    # Each unique description is only evaluated once, regardless of how often it occurs or in
+    # which of the description columns it is found. Missing values are encoded as -1.
+    description_codes, unique_descriptions = pd.factorize(
+        dataset[description_columns].to_numpy(dtype=object).ravel()
+    )
+    description_codes = description_codes.reshape(
+        len(dataset), len(description_columns)
+    )
+
+    # The match matrix contains the match value of every unique description (rows) with
+    # every keyword (columns) in the order in which the keywords are defined
+    lowered_descriptions = [description.lower() for description in unique_descriptions]
+
+    match_matrix = np.array(
+        [
+            [
+                fuzz.partial_ratio(lowered_description, keyword)
+                for keyword in distinct_keywords
+            ]
+            for lowered_description in tqdm(
+                lowered_descriptions, desc="Categorizing Transactions"
+            )
+        ],
+        dtype=np.uint8,
+    ).reshape(len(unique_descriptions), len(distinct_keywords))[:, keyword_positions]
+
+    total_matches: dict[str, int] = {}
+    for keyword, match in zip(keyword_names, match_matrix.max(axis=0, initial=0)):
+        total_matches[keyword] = max(total_matches.get(keyword, 0), int(match))
+
+    # This is done to ensure you have the best fit for the transaction. If you have a description
+    # that says "Apple Bandit" and you have the keyword "Apple" in the "Groceries" categorization
+    # and "Apple Bandit" in the "Drinks" categorization, it will be assigned to "Drinks" because
+    # the match value is higher. This would not be achieved if the first match that crosses the
+    # Threshold is reached (which would be "Groceries" in this case). On equal match values, the
+    # first defined keyword is selected.
+    qualifying_matrix = np.where(
+        match_matrix >= categorization_threshold, match_matrix, np.uint8(0)
+    )
+    best_keyword_positions = qualifying_matrix.argmax(axis=1)
+
+    # Only the best scores are widened, they are used in the column ranking below which
+    # would overflow within uint8
+    best_scores = qualifying_matrix[
+        np.arange(len(unique_descriptions)), best_keyword_positions
+    ].astype(int)
+
+    # The last position is reserved for missing values which therefore never match any category
+    # given that a code of -1 selects this position
+    unique_scores = np.append(best_scores, 0)
+    unique_category_positions = np.append(
+        np.where(
+            best_scores > 0,
+            keyword_category_positions[best_keyword_positions],
+            len(categories),
+        ),
+        len(categories),
+    )
+    unique_keywords = np.append(
+        np.where(best_scores > 0, keyword_names[best_keyword_positions], None), None
+    )
+
+    # For each transaction, select the description column with the highest match. On equal
+    # matches, the category that is defined first wins followed by the first description column.
+    column_scores = unique_scores[description_codes]
+    column_ranking = column_scores * (len(categories) + 1) - (
+        unique_category_positions[description_codes]
+    )
+    selected_codes = description_codes[
+        np.arange(len(dataset)), column_ranking.argmax(axis=1)
+    ]
+
+    # The category column is stored as a categorical so that grouping and comparing on it
+    # works on integer codes instead of strings
+    dataset["category"] = pd.Categorical(
+        np.array(categories + ["Other"], dtype=object)[
+            unique_category_positions[selected_codes]
+        ],
+        categories=list(dict.fromkeys(categories + ["Other"])),
+    )
+    dataset["keyword"] = unique_keywords[selected_codes]
+    dataset["certainty"] = unique_scores[selected_codes] / 100
 
     return dataset, total_matches
 
 
+def create_transactions_overview(
+    dataset: pd.DataFrame,
+    period_string: str,
+    period_symbol: str,
+) -> pd.DataFrame:
+    """
+    Group the transactions of the cash flow dataset by the specified period. It creates a DataFrame
+    with a MultiIndex that contains the period and the date of each transaction.
+
+    The period of each transaction is derived directly from the date index (e.g. 2023-09-13 becomes
+    2023-09 for the monthly period) instead of splitting the dataset into groups and recombining them.
+
+    Parameters:
+        dataset (pd.DataFrame): The cash flow dataset to group by the specified period.
+        period_string (str): The period to group the transactions by. This could be 'weekly',
+            'monthly', 'quarterly', or 'yearly'.
+        period_symbol (str): The frequency symbol that belongs to the period. This could be
+            'W', 'M', 'Q' or 'Y'.
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the transactions with the period as first index level.
+    """
+    period_dataset = dataset.sort_index(kind="stable")
+
+    # The period conversion is only used to create the period level, the original dates
+    # (e.g. Timestamps of a custom dataset) are kept as they are in the "Date" level
+    periods = (
+        period_dataset.index.asfreq(period_symbol)
+        if isinstance(period_dataset.index, pd.PeriodIndex)
+        else period_dataset.index.to_period(period_symbol)
+    )
+
+    period_dataset.index = pd.MultiIndex.from_arrays(
+        [periods, period_dataset.index],
+        names=[period_string.capitalize(), "Date"],
+    )
+
+    return period_dataset
+
+
 def create_period_overview(
     dataset: pd.DataFrame,
     period_string: str,
@@ -442,19 +582,19 @@ def create_period_overview(
     Returns:
         pd.DataFrame: A DataFrame containing the period overview.
     """
-    period_values = dataset.index.get_level_values(period_string.capitalize()).unique()
-
-    period_cash_flows = pd.DataFrame(columns=period_values, index=categories)
-
-    for period_value in period_values:
-        period_data = (
-            dataset.loc[period_value].groupby("category").agg({amount_column: "sum"})
-        )
-        period_data = period_data.reindex(categories).fillna(0)
-
-        period_cash_flows.loc[:, period_value] = period_data.to_numpy()
-
-    period_cash_flows = period_cash_flows.T
+    # A single grouping on both the period and the category with the periods as rows and the
+    # categories as columns, categories without transactions are added as zero (float) columns
+    period_cash_flows = dataset.pivot_table(
+        index=period_string.capitalize(),
+        columns="category",
+        values=amount_column,
+        aggfunc="sum",
+        fill_value=0.0,
+        observed=True,
+    )
+    period_cash_flows.columns = period_cash_flows.columns.astype(object)
+    period_cash_flows = period_cash_flows.reindex(columns=categories, fill_value=0.0)
+    period_cash_flows.columns.name = None
 
     if category_exclusions:
         period_cash_flows = period_cash_flows.drop(category_exclusions, axis=1)
@@ -51,11 +51,14 @@ def create_overview_excel_report(
         }
     )
 
-    for col, val in enumerate(dataset.columns):
-        worksheet.write(0, col, val, column_format)
-        worksheet.write(len(dataset) + 1, col, dataset[val].sum(), column_format)
+    # The totals of all numeric columns are calculated at once, the first column contains
+    # the periods and is therefore labelled instead of summed
+    column_totals = dataset.iloc[:, 1:].sum()
 
-    worksheet.write(len(dataset) + 1, 0, "Totals", column_format)
+    worksheet.write_row(0, 0, dataset.columns.tolist(), column_format)
+    worksheet.write_row(
+        len(dataset) + 1, 0, ["Totals"] + column_totals.tolist(), column_format
+    )
 
     # Apply number formatting
     number_format = workbook.add_format(
@@ -63,7 +66,7 @@ def create_overview_excel_report(
     )
 
     for i, col in enumerate(dataset.columns):
-        width = max(dataset[col].apply(lambda x: len(str(x))).max(), len(col)) + 1  # type: ignore
+        width = max(dataset[col].astype(str).str.len().max(), len(col)) + 1  # type: ignore
         worksheet.set_column(i, i, width, number_format)
 
     # Apply conditional formatting
@@ -128,8 +131,7 @@ def create_transactions_excel_report(
         }
     )
 
-    for col, val in enumerate(dataset.columns):
-        worksheet.write(0, col, val, column_format)
+    worksheet.write_row(0, 0, dataset.columns.tolist(), column_format)
 
     # Apply number formatting
     number_format = workbook.add_format(
@@ -142,7 +144,7 @@ def create_transactions_excel_report(
     for i, col in enumerate(dataset.columns):
         width = (
             max(
-                min(dataset[col].astype(str).apply(lambda x: len(str(x))).max(), 50),
+                min(dataset[col].astype(str).str.len().max(), 50),
                 len(col),  # type: ignore
             )
             + 1
@@ -1,14 +1,35 @@
 """Helpers Module"""
 
+import importlib.util
 import os
 
+import numpy as np
 import pandas as pd
 import requests
 import yaml
 
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+
+    ENABLE_PYARROW = True
+except ImportError:
+    ENABLE_PYARROW = False
+
+# The calamine engine requires pandas 2.2 or newer and the optional python-calamine package
+ENABLE_CALAMINE = (
+    importlib.util.find_spec("python_calamine") is not None
+    and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+)
+
 # pylint: disable=too-few-public-methods
 
 BASE_URL = "https://raw.githubusercontent.com/JerBouma/PersonalFinance/main/"
+
+# The LibYAML based loader is considerably faster, it is not available when PyYAML
+# is installed without the LibYAML bindings
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 VALID_CODE = 200
 
 
@@ -44,13 +65,88 @@ def read_excel(location: str):
         ValueError: If the specified file does not have a '.xlsx' or '.csv' extension.
     """
     if location.endswith(".xlsx"):
+        # The calamine engine is considerably faster than openpyxl, it is an optional
+        # dependency so openpyxl is used when it is not available
+        if ENABLE_CALAMINE:
+            return pd.read_excel(location, engine="calamine")
+
         return pd.read_excel(location)
     if location.endswith(".csv"):
+        # pyarrow parses the file multithreaded, it is an optional dependency so the default
+        # C engine is used when it is not available or when pyarrow can not parse the file
+        # (e.g. rows with fewer fields than the header)
+        if ENABLE_PYARROW:
+            try:
+                return read_csv_with_pyarrow(location)
+            except (pyarrow.ArrowInvalid, ValueError):
+                pass
+
         return pd.read_csv(location)
 
     raise ValueError("File type not supported. Please use .xlsx or .csv")
 
 
+def read_csv_with_pyarrow(location: str):
+    """
+    Read a CSV (.csv) file into a Pandas DataFrame with pyarrow.
+
+    The result follows the default C engine of Pandas for regular files. Columns that pyarrow
+    would infer as dates or timestamps are kept as text and the same values are treated as
+    missing, so that the date format from the configuration is applied on both paths. Integers
+    beyond the int64 range are returned as float instead of as text.
+
+    Parameters:
+        location (str): The file path of the CSV file to read.
+
+    Returns:
+        pandas.DataFrame: A DataFrame containing the data from the file.
+
+    Raises:
+        pyarrow.ArrowInvalid: If pyarrow can not parse the file.
+        ValueError: If the header contains empty or duplicate column names, which the C engine
+        renames (e.g. to 'Unnamed: 0' or 'Bedrag.1').
+    """
+    # Only the first block of the file is read to determine the column types
+    with pyarrow_csv.open_csv(location) as reader:
+        schema = reader.schema
+
+    if "" in schema.names or len(set(schema.names)) != len(schema.names):
+        raise ValueError("The header contains empty or duplicate column names.")
+
+    convert_options = pyarrow_csv.ConvertOptions(
+        column_types={
+            field.name: pyarrow.string()
+            for field in schema
+            if pyarrow.types.is_temporal(field.type)
+        },
+        # Pandas also treats "<NA>" and "None" as missing on top of the pyarrow defaults
+        null_values=[*pyarrow_csv.ConvertOptions().null_values, "<NA>", "None"],
+        strings_can_be_null=True,
+    )
+
+    table = pyarrow_csv.read_csv(location, convert_options=convert_options)
+
+    # Columns without any value are read as float by the C engine
+    table = table.cast(
+        pyarrow.schema(
+            [
+                field.with_type(pyarrow.float64())
+                if pyarrow.types.is_null(field.type)
+                else field
+                for field in table.schema
+            ]
+        )
+    )
+
+    dataset = table.to_pandas()
+
+    # Missing text values are returned as None by pyarrow and as NaN by the C engine
+    text_columns = dataset.select_dtypes(include="object").columns
+    dataset[text_columns] = dataset[text_columns].fillna(np.nan)
+
+    return dataset
+
+
 def read_yaml_file(location: str):
     """
     Read and parse a YAML file.
@@ -72,7 +168,7 @@ def read_yaml_file(location: str):
     """
     try:
         with open(location) as yaml_file:
-            data = yaml.safe_load(yaml_file)
+            data = yaml.load(yaml_file, Loader=YAML_LOADER)  # noqa: S506
         return data
     except FileNotFoundError as exc:
         raise ValueError(f"The file '{location}' does not exist.") from exc
@@ -103,19 +199,11 @@ def download_example_datasets(base_url: str | None = None):
     directory = "examples/cashflows/"
     urls = [f"{base_url}examples/cashflows/cashflow_example.csv"]
 
+    os.makedirs(directory, exist_ok=True)
+
     for url in urls:
         response = requests.get(url, timeout=60)
 
-        previous_location = None
-        for location in directory.split("/"):
-            if location:
-                if previous_location and location not in os.listdir(previous_location):
-                    os.mkdir(directory)
-                elif location not in os.listdir():
-                    os.mkdir(location)
-
-            previous_location = location
-
         if response.status_code == VALID_CODE:
             with open(directory + url.split("/")[-1], "wb") as f:
                 f.write(response.content)
@@ -162,15 +250,7 @@ def download_yaml_configuration(example: bool = False, name: str | None = None):
 
     response = requests.get(url, timeout=60)
 
-    previous_location = None
-    for location in directory.split("/"):
-        if location:
-            if previous_location and location not in os.listdir(previous_location):
-                os.mkdir(directory)
-            elif location not in os.listdir():
-                os.mkdir(location)
-
-        previous_location = location
+    os.makedirs(directory, exist_ok=True)
 
     if response.status_code == VALID_CODE:
         with open(str(directory) + str(name), "wb") as f: